@@ -0,0 +1,78 @@
+"""
+ASGI entrypoint for the serverless API
+- Same routes and responses as the BaseHTTPRequestHandler in index.py
+- Run with: uvicorn api.asgi:app --workers 4 --loop uvloop --http httptools
+"""
+
+try:
+    from .index import MAX_BODY, handle_get, handle_post
+except ImportError:
+    from index import MAX_BODY, handle_get, handle_post
+
+_OPTIONS_HEADERS = [
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-methods', b'POST, OPTIONS'),
+    (b'access-control-allow-headers', b'Content-Type'),
+]
+
+_NOT_FOUND = (404, [('Content-type', 'text/plain')], b'Not Found')
+_TOO_LARGE = (413, [('Content-type', 'text/plain')], b'Payload Too Large')
+
+async def _read_body(receive):
+    """Collect the request body, or return None once it grows past MAX_BODY"""
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY:
+            return None
+        chunks.append(chunk)
+        more_body = message.get('more_body', False)
+    return b''.join(chunks)
+
+async def _send_response(send, response):
+    status, headers, body = response
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    method = scope['method']
+    path = scope['path']
+
+    if method == 'OPTIONS':
+        await send({'type': 'http.response.start', 'status': 200, 'headers': _OPTIONS_HEADERS})
+        await send({'type': 'http.response.body', 'body': b''})
+        return
+
+    if method == 'POST':
+        # Analysis helpers are short and CPU-bound, so they run inline on the loop
+        body = await _read_body(receive)
+        response = _TOO_LARGE if body is None else handle_post(path, body)
+    elif method == 'GET':
+        response = handle_get(path)
+    else:
+        response = None
+
+    await _send_response(send, response or _NOT_FOUND)
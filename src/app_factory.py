@@ -1,23 +1,33 @@
 from flask import Flask
-from flask_cors import CORS
-from .config import Settings
-from .routes.analyze import analyze_bp
-from .routes.report import report_bp
-from .routes.auth import auth_bp
-from .models.database import db
-from .services.auth_service import auth_service
+from .config import get_settings
 
 def create_app() -> Flask:
+    # Heavy imports (CORS, SQLAlchemy models, JWT/bcrypt, NLP-backed blueprints) are deferred
+    # until an app is actually built, so importing this module stays cheap
+    from flask_cors import CORS
+    from .routes.analyze import analyze_bp
+    from .routes.report import report_bp
+    from .models.database import db
+    from .services.auth_service import auth_service
+    from .services.openai_service import OpenAISuggester
+    from .services.embeddings_service import Embeddings
+    from .services.persistence import persistence_queue
+    from .utils.json_provider import ORJSONProvider
+
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # 10 MB uploads
 
-    settings = Settings()
+    settings = get_settings()
     app.config["SETTINGS"] = settings
 
     # Database Configuration
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///resume_analyzer.db"
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["JWT_SECRET_KEY"] = "your-secret-key-change-in-production"  # Change in production!
+    app.config["ARGON2_TIME_COST"] = settings.ARGON2_TIME_COST
+    app.config["ARGON2_MEMORY_COST"] = settings.ARGON2_MEMORY_COST
+    app.config["ARGON2_PARALLELISM"] = settings.ARGON2_PARALLELISM
     
     # Initialize database
     db.init_app(app)
@@ -25,12 +35,21 @@ def create_app() -> Flask:
     # Initialize auth service
     auth_service.init_app(app)
 
+    # Analysis results are written to the database by a background worker
+    persistence_queue.init_app(app)
+
+    # One suggester per app so its OpenAI client (and connection pool) is reused across requests
+    app.extensions["openai_suggester"] = OpenAISuggester(settings.OPENAI_API_KEY)
+    app.extensions["embeddings"] = Embeddings(settings.OPENAI_API_KEY)
+
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     # Register blueprints
     app.register_blueprint(analyze_bp, url_prefix="/api")
     app.register_blueprint(report_bp, url_prefix="/api")
-    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    if settings.ENABLE_AUTH:
+        from .routes.auth import auth_bp
+        app.register_blueprint(auth_bp, url_prefix="/api/auth")
 
     @app.get("/health")
     def health():
@@ -40,7 +59,7 @@ def create_app() -> Flask:
             "features": {
                 "core_analysis": True,
                 "semantic_similarity": True,
-                "authentication": True,
+                "authentication": settings.ENABLE_AUTH,
                 "enhanced_ats": True,
                 "entity_extraction": True,
                 "analysis_history": True,
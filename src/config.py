@@ -1,7 +1,19 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     OPENAI_API_KEY: str | None = None
     FLASK_ENV: str = "development"
     PORT: int = 5000
-    model_config = {"env_file": ".env", "extra": "ignore"}
\ No newline at end of file
+    ENABLE_AUTH: bool = True
+    # Argon2id password hashing cost (argon2-cffi defaults)
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    model_config = {"env_file": ".env", "extra": "ignore", "frozen": True}
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settings parsed from the environment/.env once per process and shared by every app"""
+    return Settings()
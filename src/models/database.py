@@ -4,9 +4,9 @@ Database models for Phase 2
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import get_jwt_identity
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
-import bcrypt
+from ..services.auth_service import auth_service
 
 db = SQLAlchemy()
 
@@ -22,17 +22,16 @@ class User(db.Model):
     last_login = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
     
-    # Relationships
-    analyses = relationship('Analysis', backref='user', lazy=True)
+    # Relationships (lazy='raise': load explicitly with selectinload instead of per-row SELECTs)
+    analyses = relationship('Analysis', back_populates='user', lazy='raise')
     
     def set_password(self, password: str):
         """Hash and set password"""
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = auth_service.hash_password(password)
     
     def check_password(self, password: str) -> bool:
         """Check if password matches hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return auth_service.verify_password(password, self.password_hash)
     
     def update_last_login(self):
         """Update last login timestamp"""
@@ -51,6 +50,8 @@ class User(db.Model):
 
 class Analysis(db.Model):
     __tablename__ = 'analyses'
+    # History listing filters by user and orders by created_at; a b-tree serves both (scanned in reverse for DESC)
+    __table_args__ = (Index('ix_analyses_user_created', 'user_id', 'created_at'),)
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=True)  # nullable for anonymous users
@@ -74,6 +75,10 @@ class Analysis(db.Model):
     analysis_version = Column(String(50), default='2.0')
     processing_time = Column(Float, nullable=True)  # seconds
     
+    # Relationships
+    user = relationship('User', back_populates='analyses', lazy='raise')
+    history = relationship('AnalysisHistory', back_populates='analysis', lazy='raise')
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -93,6 +98,7 @@ class Analysis(db.Model):
 
 class AnalysisHistory(db.Model):
     __tablename__ = 'analysis_history'
+    __table_args__ = (Index('ix_history_user_ts', 'user_id', 'timestamp'),)
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -102,7 +108,7 @@ class AnalysisHistory(db.Model):
     details = Column(JSON, nullable=True)  # Additional action details
     
     # Relationships
-    analysis = relationship('Analysis', backref='history', lazy=True)
+    analysis = relationship('Analysis', back_populates='history', lazy='raise')
 
 def init_db(app):
     """Initialize database with app"""
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional
 
 class AnalyzeRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     resume_text: Optional[str] = None
     job_description_text: Optional[str] = None
 
@@ -1,6 +1,10 @@
 from flask import Blueprint, request, jsonify, current_app
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import hashlib
 import logging
+import orjson
 
 # Import services
 from ..models.schemas import AnalyzeRequest
@@ -9,16 +13,26 @@ from ..services.nlp_service import extract_keywords_for_jd, extract_sections, ex
 from ..services.scoring_service import keyword_coverage
 from ..services.ats_checks import ats_heuristics, analyze_ats_compatibility
 from ..services.openai_service import OpenAISuggester
+from ..services.suggestion_cache import suggestion_cache
 from ..services.semantic_service import section_semantic_alignment
 from ..services.auth_service import auth_service
-from ..models.database import Analysis, AnalysisHistory, db
+from ..services.persistence import persistence_queue
+from ..models.database import Analysis
+from sqlalchemy.orm import load_only
 from ..utils.text_utils import normalize_ws
+from ..utils.cache_utils import TTLCache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 analyze_bp = Blueprint("analyze", __name__)
 
+# Finished analyses keyed by _analysis_key; entries live for an hour
+_analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Shared pool for the independent analysis stages; threads start lazily on first use
+_stage_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="analyze-stage")
+
 def get_user_from_token() -> Optional[Dict[str, Any]]:
     """Extract user information from authorization token"""
     try:
@@ -39,6 +53,15 @@ def get_user_from_token() -> Optional[Dict[str, Any]]:
 @analyze_bp.post("/analyze")
 def analyze():
     """Comprehensive resume analysis with all features"""
+    payload, status = analyze_current_request()
+    return jsonify(payload), status
+
+def analyze_current_request() -> Tuple[Dict[str, Any], int]:
+    """Run the analysis for the current request and return (response payload, HTTP status).
+
+    Shared by /analyze and /report/pdf so the report works on the dict directly instead of
+    round-tripping it through JSON.
+    """
     try:
         # Get user from token (optional for anonymous analysis)
         user_payload = get_user_from_token()
@@ -47,11 +70,16 @@ def analyze():
         resume_text = None
         jd_text = None
         file_format = "pdf"  # Default format
+        # ?mode=basic skips the enhanced stages (entities, embeddings, ATS deep-dive, content quality)
+        enhanced = request.args.get("mode", "enhanced") != "basic"
 
         # Handle different input formats
         if request.content_type and "application/json" in request.content_type:
-            data = request.get_json(silent=True) or {}
-            req = AnalyzeRequest(**data)
+            try:
+                data = orjson.loads(request.get_data(cache=False)) or {}
+            except orjson.JSONDecodeError:
+                data = {}
+            req = AnalyzeRequest.model_validate(data)
             resume_text = normalize_ws(req.resume_text or "")
             jd_text = normalize_ws(req.job_description_text or "")
             file_format = data.get("file_format", "pdf").lower()
@@ -65,73 +93,23 @@ def analyze():
                 jd_text = normalize_ws(jd_text or "")
 
         if not resume_text or not jd_text:
-            return jsonify({
+            return {
                 "error": "Both resume text and job description text are required",
                 "details": "Provide resume_text and job_description_text in JSON, or upload files 'resume' and 'job_description'"
-            }), 400
-
-        # Core Analysis (Original functionality)
-        jd_keywords = extract_keywords_for_jd(jd_text, limit=50)
-        coverage, missing, keyword_score = keyword_coverage(resume_text, jd_keywords)
-        checks, ats_score = ats_heuristics(resume_text)
-
-        resume_sections = extract_sections(resume_text)
-        section_alignment = section_semantic_alignment(resume_sections, jd_text)
-        avg_section = round(sum(s.similarity for s in section_alignment)/max(1,len(section_alignment)), 1)
-
-        overall = round(0.5 * keyword_score + 0.3 * ats_score + 0.2 * avg_section, 1)
+            }, 400
 
-        settings = current_app.config.get("SETTINGS")
-        suggester = OpenAISuggester(getattr(settings, "OPENAI_API_KEY", None))
-        suggestions = suggester.suggest(resume_text, jd_text)[:5]
-
-        summary = (f"Keyword coverage: {keyword_score:.1f}%. ATS checks: {ats_score:.1f}%. "
-                   f"Section alignment avg: {avg_section}%. Overall: {overall:.1f}%. Missing {len(missing)} key terms.")
-
-        # Enhanced Analysis Features
-        enhanced_features = {}
-        
-        try:
-            # Named entity extraction
-            entities = extract_named_entities(resume_text)
-            enhanced_features['entities'] = entities
-            
-            # Semantic similarity analysis
-            semantic_similarity = calculate_semantic_similarity(resume_text, jd_text)
-            enhanced_features['semantic_similarity'] = semantic_similarity
-            
-            # Enhanced section alignment
-            if resume_sections:
-                enhanced_section_alignment = analyze_section_alignment(resume_sections, jd_text)
-                enhanced_features['section_alignment'] = enhanced_section_alignment
-            
-            # Enhanced ATS analysis
-            ats_analysis = analyze_ats_compatibility(resume_text, file_format)
-            enhanced_features['ats_analysis'] = ats_analysis
-            
-            # Content quality analysis
-            content_quality = _analyze_content_quality(resume_text, jd_text)
-            enhanced_features['content_quality'] = content_quality
-            
-        except Exception as e:
-            logger.warning(f"Enhanced analysis failed: {e}")
-            enhanced_features['error'] = str(e)
+        # Identical inputs reuse the finished analysis; metadata is always per request
+        cache_key = _analysis_key(resume_text, jd_text, file_format, enhanced)
+        result = _analysis_cache.get(cache_key)
+        if result is None:
+            result = _run_analysis(resume_text, jd_text, file_format, enhanced)
+            # Don't pin a partial result from a transient enhanced-analysis failure
+            if "error" not in result["enhanced_features"]:
+                _analysis_cache.set(cache_key, result)
 
         # Prepare response
         response_data = {
-            "summary": summary,
-            "missing_keywords": missing[:25],
-            "coverage": coverage[:50],
-            "scores": {
-                "ats_score": ats_score,
-                "keyword_score": keyword_score,
-                "overall_score": overall,
-                "checks": checks,
-                "section_alignment": [s.__dict__ for s in section_alignment],
-            },
-            "suggestions": suggestions,
-            "ai": {"openai_enabled": bool(getattr(suggester, "enabled", False))},
-            "enhanced_features": enhanced_features,
+            **result,
             "analysis_metadata": {
                 "timestamp": datetime.utcnow().isoformat(),
                 "user_id": user_id,
@@ -140,20 +118,116 @@ def analyze():
             }
         }
 
-        # Save to database if user is authenticated
+        # Save to database if user is authenticated; the write happens off the request path
         if user_id:
-            try:
-                _save_analysis_to_db(user_id, response_data)
-                response_data["analysis_metadata"]["saved_to_history"] = True
-            except Exception as e:
-                logger.error(f"Failed to save analysis: {e}")
-                response_data["analysis_metadata"]["saved_to_history"] = False
+            persistence_queue.put(user_id, response_data)
+            response_data["analysis_metadata"]["saved_to_history"] = "pending"
 
-        return jsonify(response_data), 200
+        return response_data, 200
 
     except Exception as e:
         logger.error(f"Analysis error: {e}")
-        return jsonify({"error": "Analysis failed", "details": str(e)}), 500
+        return {"error": "Analysis failed", "details": str(e)}, 500
+
+def _analysis_key(resume_text: str, jd_text: str, file_format: str, enhanced: bool = True) -> str:
+    """Cache key for an analysis: a BLAKE2b digest of the normalized inputs"""
+    raw = "\x00".join((resume_text, jd_text, file_format, "enhanced" if enhanced else "basic")).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _get_suggestions(suggester: OpenAISuggester, resume_text: str, jd_text: str) -> list:
+    if not suggester.enabled:
+        return []
+    # Near-identical resume/JD pairs reuse earlier LLM suggestions
+    suggestions = suggestion_cache.get(resume_text, jd_text)
+    if suggestions is None:
+        suggestions = suggester.suggest(resume_text, jd_text)[:5]
+        if suggestions:
+            suggestion_cache.add(resume_text, jd_text, suggestions)
+    return suggestions
+
+def _submit(fn, *args):
+    """Run fn on the stage pool inside a copy of the caller's context (keeps current_app available)"""
+    return _stage_pool.submit(contextvars.copy_context().run, fn, *args)
+
+def _run_analysis(resume_text: str, jd_text: str, file_format: str, enhanced: bool = True) -> Dict[str, Any]:
+    """Analysis pipeline for one resume/JD pair, without per-request metadata.
+
+    With enhanced=False only the core keyword/ATS/section scoring runs (no entity
+    extraction, embeddings, ATS deep-dive or content quality stages).
+    """
+    suggester = current_app.extensions["openai_suggester"]
+
+    # Independent stages run concurrently; wall-clock time is roughly the slowest one
+    # (usually the OpenAI call or the embedding model)
+    f_keywords = _submit(extract_keywords_for_jd, jd_text, 50)
+    f_ats = _submit(ats_heuristics, resume_text)
+    f_suggestions = _submit(_get_suggestions, suggester, resume_text, jd_text)
+    if enhanced:
+        f_entities = _submit(extract_named_entities, resume_text)
+        f_similarity = _submit(calculate_semantic_similarity, resume_text, jd_text)
+        f_ats_analysis = _submit(analyze_ats_compatibility, resume_text, file_format)
+        f_quality = _submit(_analyze_content_quality, resume_text, jd_text)
+
+    resume_sections = extract_sections(resume_text)
+    f_alignment = _submit(section_semantic_alignment, resume_sections, jd_text)
+    f_enhanced_alignment = None
+    if enhanced and resume_sections:
+        f_enhanced_alignment = _submit(analyze_section_alignment, resume_sections, jd_text)
+
+    # Core Analysis (Original functionality)
+    coverage, missing, keyword_score = keyword_coverage(resume_text, f_keywords.result(), coverage_limit=50)
+    checks, ats_score = f_ats.result()
+
+    section_alignment = f_alignment.result()
+    avg_section = round(sum(s.similarity for s in section_alignment)/max(1,len(section_alignment)), 1)
+
+    overall = round(0.5 * keyword_score + 0.3 * ats_score + 0.2 * avg_section, 1)
+
+    suggestions = f_suggestions.result()
+
+    summary = (f"Keyword coverage: {keyword_score:.1f}%. ATS checks: {ats_score:.1f}%. "
+               f"Section alignment avg: {avg_section}%. Overall: {overall:.1f}%. Missing {len(missing)} key terms.")
+
+    # Enhanced Analysis Features
+    enhanced_features = {}
+
+    if enhanced:
+        try:
+            # Named entity extraction
+            enhanced_features['entities'] = f_entities.result()
+
+            # Semantic similarity analysis
+            enhanced_features['semantic_similarity'] = f_similarity.result()
+
+            # Enhanced section alignment
+            if f_enhanced_alignment is not None:
+                enhanced_features['section_alignment'] = f_enhanced_alignment.result()
+
+            # Enhanced ATS analysis
+            enhanced_features['ats_analysis'] = f_ats_analysis.result()
+
+            # Content quality analysis
+            enhanced_features['content_quality'] = f_quality.result()
+
+        except Exception as e:
+            logger.warning(f"Enhanced analysis failed: {e}")
+            enhanced_features['error'] = str(e)
+
+    return {
+        "summary": summary,
+        "missing_keywords": missing[:25],
+        "coverage": coverage,
+        "scores": {
+            "ats_score": ats_score,
+            "keyword_score": keyword_score,
+            "overall_score": overall,
+            "checks": checks,
+            "section_alignment": [s.__dict__ for s in section_alignment],
+        },
+        "suggestions": suggestions,
+        "ai": {"openai_enabled": bool(getattr(suggester, "enabled", False))},
+        "enhanced_features": enhanced_features,
+    }
 
 def _analyze_content_quality(resume_text: str, jd_text: str) -> Dict[str, Any]:
     """Analyze overall content quality and completeness"""
@@ -203,45 +277,6 @@ def _analyze_content_quality(resume_text: str, jd_text: str) -> Dict[str, Any]:
     
     return analysis
 
-def _save_analysis_to_db(user_id: int, analysis_data: Dict[str, Any]) -> Optional[int]:
-    """Save analysis results to database"""
-    try:
-        # Create analysis record
-        analysis = Analysis(
-            user_id=user_id,
-            resume_text=analysis_data.get('input', {}).get('resume_text', '')[:5000],  # Truncate for storage
-            job_description_text=analysis_data.get('input', {}).get('job_description_text', '')[:5000],
-            scores=analysis_data.get('scores', {}),
-            keyword_analysis=analysis_data.get('keyword_analysis', {}),
-            ats_analysis=analysis_data.get('ats_analysis', {}),
-            semantic_analysis=analysis_data.get('enhanced_features', {}).get('semantic_similarity', {}),
-            named_entities=analysis_data.get('enhanced_features', {}).get('entities', {}),
-            suggestions=analysis_data.get('suggestions', []),
-            created_at=datetime.utcnow()
-        )
-        
-        db.session.add(analysis)
-        db.session.commit()
-        
-        # Create history record
-        history = AnalysisHistory(
-            user_id=user_id,
-            analysis_id=analysis.id,
-            action='analysis_completed',
-            timestamp=datetime.utcnow()
-        )
-        
-        db.session.add(history)
-        db.session.commit()
-        
-        logger.info(f"Saved analysis {analysis.id} for user {user_id}")
-        return analysis.id
-        
-    except Exception as e:
-        logger.error(f"Failed to save analysis to database: {e}")
-        db.session.rollback()
-        return None
-
 @analyze_bp.route("/analyze-history", methods=["GET"])
 def get_analysis_history():
     """Get user's analysis history"""
@@ -255,7 +290,9 @@ def get_analysis_history():
         limit = int(request.args.get("limit", 10))
         
         # Get analysis history
-        analyses = Analysis.query.filter_by(user_id=user_id)\
+        # Only the columns the listing needs; the resume/JD text and JSON blobs stay in the DB
+        analyses = Analysis.query.options(load_only(Analysis.id, Analysis.scores, Analysis.created_at))\
+                                .filter_by(user_id=user_id)\
                                 .order_by(Analysis.created_at.desc())\
                                 .limit(limit)\
                                 .all()
@@ -7,15 +7,22 @@ Authentication Routes for Phase 2
 from flask import Blueprint, request, jsonify, current_app
 from typing import Dict, Any
 import logging
+import re
+from datetime import datetime
 
 # Import services and models
 from ..services.auth_service import auth_service
 from ..models.database import User, db
+from ..services.persistence import persistence_queue, record_login
 
 logger = logging.getLogger(__name__)
 
 auth_bp = Blueprint("auth", __name__)
 
+# local@domain.tld with no whitespace or extra '@'; deliverability isn't checked
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_MAX_EMAIL_LENGTH = 254  # RFC 5321 path limit
+
 @auth_bp.route("/register", methods=["POST"])
 def register():
     """User registration endpoint"""
@@ -33,12 +40,12 @@ def register():
         if not all([email, password, first_name, last_name]):
             return jsonify({"error": "Email, password, first_name, and last_name are required"}), 400
         
-        # Validate email format
-        if "@" not in email or "." not in email:
+        # Validate email format (length first, so oversized input never reaches the regex)
+        if len(email) > _MAX_EMAIL_LENGTH or not _EMAIL_RE.fullmatch(email):
             return jsonify({"error": "Invalid email format"}), 400
         
         # Check if user already exists
-        existing_user = User.query.filter_by(email=email).first()
+        existing_user = db.session.query(User.id).filter_by(email=email).first()
         if existing_user:
             return jsonify({"error": "User with this email already exists"}), 409
         
@@ -67,7 +74,7 @@ def register():
         # Generate tokens
         tokens = auth_service.generate_tokens(new_user.id, new_user.email)
         
-        logger.info(f"New user registered: {email}")
+        logger.info("New user registered: %s", email)
         
         return jsonify({
             "message": "User registered successfully",
@@ -82,7 +89,7 @@ def register():
         }), 201
         
     except Exception as e:
-        logger.error(f"Registration error: {e}")
+        logger.error("Registration error: %s", e)
         db.session.rollback()
         return jsonify({"error": "Registration failed"}), 500
 
@@ -100,18 +107,29 @@ def login():
         if not email or not password:
             return jsonify({"error": "Email and password are required"}), 400
         
+        # Registration never stores an address this long, so skip the lookup
+        if len(email) > _MAX_EMAIL_LENGTH:
+            return jsonify({"error": "Invalid email or password"}), 401
+        
         # Find user
         user = User.query.filter_by(email=email).first()
+        
+        # Verify password; unknown emails still pay for a hash so response time
+        # doesn't reveal whether an account exists
         if not user:
+            auth_service.verify_dummy_password(password)
             return jsonify({"error": "Invalid email or password"}), 401
-        
-        # Verify password
         if not auth_service.verify_password(password, user.password_hash):
             return jsonify({"error": "Invalid email or password"}), 401
         
-        # Update last login
-        user.update_last_login()
-        db.session.commit()
+        # Upgrade legacy bcrypt (or outdated Argon2) hashes while we have the plaintext
+        new_password_hash = None
+        if auth_service.needs_rehash(user.password_hash):
+            new_password_hash = auth_service.hash_password(password)
+        
+        # Record the login in the background; the client only needs the tokens
+        login_time = datetime.utcnow()
+        persistence_queue.submit(record_login, user.id, login_time, new_password_hash, user.password_hash)
         
         # Generate tokens
         tokens = auth_service.generate_tokens(user.id, user.email)
@@ -121,7 +139,7 @@ def login():
         user_agent = request.headers.get('User-Agent', 'unknown')
         session_data = auth_service.create_user_session(user.id, ip_address, user_agent)
         
-        logger.info(f"User logged in: {email}")
+        logger.info("User logged in: %s", email)
         
         return jsonify({
             "message": "Login successful",
@@ -130,14 +148,14 @@ def login():
                 "email": user.email,
                 "first_name": user.first_name,
                 "last_name": user.last_name,
-                "last_login": user.last_login.isoformat() if user.last_login else None
+                "last_login": login_time.isoformat()
             },
             "tokens": tokens,
             "session": session_data
         }), 200
         
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return jsonify({"error": "Login failed"}), 500
 
 @auth_bp.route("/refresh", methods=["POST"])
@@ -163,7 +181,7 @@ def refresh_token():
         }), 200
         
     except Exception as e:
-        logger.error(f"Token refresh error: {e}")
+        logger.error("Token refresh error: %s", e)
         return jsonify({"error": "Token refresh failed"}), 500
 
 @auth_bp.route("/logout", methods=["POST"])
@@ -187,7 +205,7 @@ def logout():
             return jsonify({"error": "Invalid token"}), 401
             
     except Exception as e:
-        logger.error(f"Logout error: {e}")
+        logger.error("Logout error: %s", e)
         return jsonify({"error": "Logout failed"}), 500
 
 @auth_bp.route("/profile", methods=["GET"])
@@ -209,7 +227,7 @@ def get_profile():
             return jsonify({"error": "Invalid or expired token"}), 401
         
         # Get user
-        user = User.query.get(payload["user_id"])
+        user = db.session.get(User, payload["user_id"])
         if not user:
             return jsonify({"error": "User not found"}), 404
         
@@ -225,7 +243,7 @@ def get_profile():
         }), 200
         
     except Exception as e:
-        logger.error(f"Profile fetch error: {e}")
+        logger.error("Profile fetch error: %s", e)
         return jsonify({"error": "Failed to fetch profile"}), 500
 
 @auth_bp.route("/profile", methods=["PUT"])
@@ -247,7 +265,7 @@ def update_profile():
             return jsonify({"error": "Invalid or expired token"}), 401
         
         # Get user
-        user = User.query.get(payload["user_id"])
+        user = db.session.get(User, payload["user_id"])
         if not user:
             return jsonify({"error": "User not found"}), 404
         
@@ -283,7 +301,7 @@ def update_profile():
         
         db.session.commit()
         
-        logger.info(f"Profile updated for user: {user.email}")
+        logger.info("Profile updated for user: %s", user.email)
         
         return jsonify({
             "message": "Profile updated successfully",
@@ -298,7 +316,7 @@ def update_profile():
         }), 200
         
     except Exception as e:
-        logger.error(f"Profile update error: {e}")
+        logger.error("Profile update error: %s", e)
         db.session.rollback()
         return jsonify({"error": "Failed to update profile"}), 500
 
@@ -328,5 +346,5 @@ def validate_token():
         }), 200
         
     except Exception as e:
-        logger.error(f"Token validation error: {e}")
+        logger.error("Token validation error: %s", e)
         return jsonify({"valid": False, "error": "Token validation failed"}), 500
@@ -1,27 +1,37 @@
 from __future__ import annotations
-from flask import Blueprint, make_response, request
-from .analyze import analyze
+from flask import Blueprint, jsonify, make_response, request
+from .analyze import analyze_current_request
 from ..services.report_service import build_pdf_report
 
 report_bp = Blueprint("report", __name__)
 
+def _is_renderable(analysis: dict) -> bool:
+    """True if a client-posted analysis has the shapes build_pdf_report reads"""
+    scores = analysis.get("scores", {})
+    if not isinstance(scores, dict):
+        return False
+    sections = scores.get("section_alignment", [])
+    if not isinstance(sections, list) or not all(isinstance(sec, dict) for sec in sections):
+        return False
+    return (isinstance(analysis.get("summary", ""), str)
+            and isinstance(analysis.get("missing_keywords", []), list)
+            and isinstance(analysis.get("suggestions", []), list))
+
 @report_bp.post("/report/pdf")
 def report_pdf():
-    resp = analyze()
-    if isinstance(resp, tuple):
-        data, status = resp
-        if status != 200:
-            return resp
-        analysis = data.get_json()
+    # Clients that already ran /analyze can post {"analysis": <that response>} and skip re-analysis;
+    # otherwise the inputs are analyzed (identical inputs are served from the analysis cache)
+    body = request.get_json(silent=True) if request.is_json else None
+    analysis = body.get("analysis") if isinstance(body, dict) else None
+    if isinstance(analysis, dict):
+        if not _is_renderable(analysis):
+            return jsonify({"error": "Malformed analysis"}), 400
     else:
-        analysis = resp.get_json()
-
-    if request.is_json:
-        body = request.get_json(silent=True) or {}
-        analysis["_inputs"] = body
+        analysis, status = analyze_current_request()
+        if status != 200:
+            return jsonify(analysis), status
 
-    pdf_bytes = build_pdf_report(analysis)
-    r = make_response(pdf_bytes)
+    r = make_response(build_pdf_report(analysis))
     r.headers.set('Content-Type', 'application/pdf')
     r.headers.set('Content-Disposition', 'attachment', filename='resume-analysis.pdf')
-    return r
\ No newline at end of file
+    return r
@@ -1,11 +1,16 @@
 # Enhanced Flask Routes for Resume Generator
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, make_response
 from werkzeug.utils import secure_filename
 import os
 import tempfile
-from io import BytesIO
 import json
 import logging
+import re
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
 
 from src.services.resume_generator import (
     ResumeParser, JobDescriptionAnalyzer, BulletRewriter, 
@@ -27,6 +32,20 @@ bullet_rewriter = BulletRewriter()
 ats_validator = ATSValidator()
 resume_generator = ResumeGenerator()
 
+def _warm_up_services():
+    """Run the parse/keyword/ATS path once at import so the first real request doesn't pay
+    spaCy's first-call setup (under gunicorn --preload this happens once, in the master)"""
+    try:
+        parsed = resume_parser.parse_text("Jane Doe\njane@example.com\n\nSummary\nSoftware engineer.")
+        jd_analyzer.extract_keywords("Python engineer with AWS and Docker experience", use_llm=False)
+        ats_validator.validate(parsed)
+    except Exception as e:
+        logger.warning("Service warm-up failed: %s", e)
+
+# Tests and scripts that only import this module skip the warm-up (SKIP_WARMUP=1)
+if not app.config.get('TESTING') and os.environ.get('SKIP_WARMUP') != '1':
+    _warm_up_services()
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_resume():
     """Analyze resume against job description"""
@@ -34,6 +53,7 @@ def analyze_resume():
         # Handle file upload or text input
         resume_text = ""
         job_description = ""
+        use_llm = False
         
         if 'resume' in request.files:
             # File upload mode
@@ -53,14 +73,16 @@ def analyze_resume():
                     return jsonify({'error': 'Unsupported file format'}), 400
             
             job_description = request.form.get('job_description', '')
+            use_llm = request.form.get('use_llm', 'false').lower() == 'true'
         else:
             # JSON mode
-            data = request.get_json()
+            data = request.get_json(silent=True)
             if not data:
                 return jsonify({'error': 'No data provided'}), 400
             
             resume_text = data.get('resume_text', '')
             job_description = data.get('job_description', '')
+            use_llm = data.get('use_llm', False)
         
         if not resume_text or not job_description:
             return jsonify({'error': 'Both resume and job description are required'}), 400
@@ -69,18 +91,21 @@ def analyze_resume():
         parsed_resume = resume_parser.parse_text(resume_text)
         
         # Analyze job description
-        options = request.get_json() or {}
-        use_llm = options.get('use_llm', False)
         jd_keywords = jd_analyzer.extract_keywords(job_description, use_llm)
         
+        # Match every JD keyword against the resume once; scores and gaps share the result
+        resume_summary = summarize_resume(parsed_resume)
+        matched_terms = find_matched_terms(resume_summary[0], jd_keywords)
+        
+        # ATS compliance check (also feeds the ATS score)
+        compliance_issues = ats_validator.validate(parsed_resume)
+        
         # Calculate scores
-        scores = calculate_scores(parsed_resume, jd_keywords, job_description)
+        scores = calculate_scores(parsed_resume, jd_keywords, job_description, matched_terms, resume_summary,
+                                  compliance_issues)
         
         # Find gaps
-        gaps = find_keyword_gaps(parsed_resume, jd_keywords)
-        
-        # ATS compliance check
-        compliance_issues = ats_validator.validate(parsed_resume)
+        gaps = find_keyword_gaps(parsed_resume, jd_keywords, matched_terms)
         
         # Convert ResumeSchema to dict for JSON serialization
         resume_dict = {
@@ -146,12 +171,12 @@ def generate_resume():
             mimetype = 'text/html'
             filename = f'resume_{template}.html'
         
-        return send_file(
-            BytesIO(resume_bytes),
-            mimetype=mimetype,
-            as_attachment=True,
-            download_name=filename
-        )
+        # The bytes are already in memory; send them as the body in one write instead of
+        # wrapping them in a BytesIO that send_file streams back out in 8 KiB chunks
+        response = make_response(resume_bytes)
+        response.headers.set('Content-Type', mimetype)
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+        return response
         
     except Exception as e:
         logger.error(f"Generation failed: {str(e)}")
@@ -204,41 +229,71 @@ def extract_keywords():
         logger.error(f"Keyword extraction failed: {str(e)}")
         return jsonify({'error': 'Keyword extraction failed', 'details': str(e)}), 500
 
-def calculate_scores(resume_data: ResumeSchema, jd_keywords: list, jd_text: str) -> dict:
+# A bullet "has a metric" when it contains both a digit and a '%'; both checks are C-level scans
+_HAS_DIGIT = re.compile(r'\d').search
+
+def summarize_resume(resume_data: ResumeSchema) -> tuple:
+    """Single walk over the resume returning (matching text, total bullets, bullets with metrics).
+
+    The matching text is the lowercased summary, skills and experience bullets that JD
+    keywords are matched against.
+    """
+    parts = [resume_data.summary, ' '.join(resume_data.skills)]
+    total_bullets = 0
+    bullets_with_metrics = 0
+    for exp in resume_data.experience:
+        bullets = exp.get('bullets', [])
+        parts.append(' '.join(bullets))
+        total_bullets += len(bullets)
+        for bullet in bullets:
+            if '%' in bullet and _HAS_DIGIT(bullet):
+                bullets_with_metrics += 1
+    return ' '.join(parts).lower(), total_bullets, bullets_with_metrics
+
+def find_matched_terms(resume_text_lower: str, jd_keywords: list) -> set:
+    """Lowercased keyword terms that occur in the resume text, found in a single pass"""
+    terms = {keyword['term'].lower() for keyword in jd_keywords}
+    words = [term for term in terms if term]  # the automaton rejects empty keys
+    if ahocorasick is None or not words:
+        return {term for term in terms if term in resume_text_lower}
+    automaton = ahocorasick.Automaton()
+    for term in words:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    matched = {term for _, term in automaton.iter(resume_text_lower)}
+    return matched | ({''} & terms)  # '' is in every string, as with a plain `in` check
+
+def calculate_scores(resume_data: ResumeSchema, jd_keywords: list, jd_text: str,
+                     matched_terms: set = None, resume_summary: tuple = None,
+                     ats_issues: list = None) -> dict:
     """Calculate various scores for the resume"""
     
-    # Keyword coverage score
-    resume_text = f"{resume_data.summary} {' '.join(resume_data.skills)}"
-    for exp in resume_data.experience:
-        resume_text += f" {' '.join(exp.get('bullets', []))}"
+    if resume_summary is None:
+        resume_summary = summarize_resume(resume_data)
+    resume_text_lower, total_bullets, bullets_with_metrics = resume_summary
     
-    resume_text_lower = resume_text.lower()
+    # Keyword coverage score
+    if matched_terms is None:
+        matched_terms = find_matched_terms(resume_text_lower, jd_keywords)
     
     keyword_matches = 0
     total_keywords = len(jd_keywords)
     
     for keyword in jd_keywords:
-        if keyword['term'].lower() in resume_text_lower:
+        if keyword['term'].lower() in matched_terms:
             keyword_matches += keyword.get('importance', 0.5)
     
     keyword_score = (keyword_matches / max(total_keywords, 1)) * 100 if total_keywords > 0 else 0
     
     # ATS score based on compliance
-    ats_issues = ats_validator.validate(resume_data)
+    if ats_issues is None:
+        ats_issues = ats_validator.validate(resume_data)
     critical_issues = sum(1 for issue in ats_issues if issue['severity'] == 'critical')
     high_issues = sum(1 for issue in ats_issues if issue['severity'] == 'high')
     
     ats_score = max(0, 100 - (critical_issues * 30) - (high_issues * 15))
     
     # Impact density (bullets with metrics)
-    total_bullets = sum(len(exp.get('bullets', [])) for exp in resume_data.experience)
-    bullets_with_metrics = 0
-    
-    for exp in resume_data.experience:
-        for bullet in exp.get('bullets', []):
-            if any(char.isdigit() for char in bullet) and '%' in bullet:
-                bullets_with_metrics += 1
-    
     impact_density = (bullets_with_metrics / max(total_bullets, 1)) * 100 if total_bullets > 0 else 0
     
     # Overall score
@@ -253,21 +308,25 @@ def calculate_scores(resume_data: ResumeSchema, jd_keywords: list, jd_text: str)
         'matched_keywords': keyword_matches
     }
 
-def find_keyword_gaps(resume_data: ResumeSchema, jd_keywords: list) -> list:
+def find_keyword_gaps(resume_data: ResumeSchema, jd_keywords: list, matched_terms: set = None) -> list:
     """Find missing keywords from job description"""
     
-    resume_text = f"{resume_data.summary} {' '.join(resume_data.skills)}"
-    for exp in resume_data.experience:
-        resume_text += f" {' '.join(exp.get('bullets', []))}"
-    
-    resume_text_lower = resume_text.lower()
+    if matched_terms is None:
+        matched_terms = find_matched_terms(summarize_resume(resume_data)[0], jd_keywords)
     
     gaps = []
+    seen = set()
     for keyword in jd_keywords:
-        if keyword['term'].lower() not in resume_text_lower:
+        term = keyword['term'].lower()
+        if term in seen:
+            continue
+        seen.add(term)
+        if term not in matched_terms:
             gaps.append(keyword['term'])
+            if len(gaps) >= 10:  # Top 10 missing keywords
+                break
     
-    return gaps[:10]  # Top 10 missing keywords
+    return gaps
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -8,11 +8,27 @@ Comprehensive ATS Analysis Service
 
 import re
 import logging
+from collections import Counter
 from typing import Dict, List, Any, Tuple
 from ..utils.text_utils import has_sections, detect_contact_info
 
 logger = logging.getLogger(__name__)
 
+_EXCESSIVE_SPACES_RE = re.compile(r' {3,}')
+# Same matches as (^|\n)\s*[•\-\*], but ^ lets the engine jump between line starts
+_BULLET_RE = re.compile(r"^\s*[•\-\*]", re.MULTILINE)
+
+# File format -> ATS score and advice
+_FORMAT_SCORES = {
+    'pdf': {'score': 90, 'recommendation': 'Excellent choice - widely supported'},
+    'docx': {'score': 85, 'recommendation': 'Good choice - well supported'},
+    'doc': {'score': 70, 'recommendation': 'Acceptable but consider newer formats'},
+    'txt': {'score': 95, 'recommendation': 'Perfect for ATS but may lack formatting'},
+    'rtf': {'score': 75, 'recommendation': 'Acceptable but less common'},
+    'html': {'score': 60, 'recommendation': 'May have parsing issues'},
+    'unknown': {'score': 50, 'recommendation': 'Unknown format - use PDF or DOCX'}
+}
+
 class ATSService:
     def __init__(self):
         # ATS-unfriendly patterns
@@ -39,6 +55,20 @@ class ATSService:
                 r'\n\s*\n\s*\n',    # Multiple line breaks
             ]
         }
+        # Compiled once here; every analysis call matches case-insensitively
+        self.problematic_patterns = {
+            category: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for category, patterns in self.problematic_patterns.items()
+        }
+        # Categories whose patterns can never overlap are scanned in one pass as a single
+        # alternation; the others (e.g. 'graph' vs 'graphic') must keep per-pattern counts
+        self._combined_patterns = {
+            category: re.compile(
+                '|'.join(f'(?P<g{i}>{p.pattern})' for i, p in enumerate(self.problematic_patterns[category])),
+                re.IGNORECASE,
+            )
+            for category in ('formatting_issues',)
+        }
         
         # Contact information patterns
         self.contact_patterns = {
@@ -46,7 +76,12 @@ class ATSService:
             'phone': r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
             'linkedin': r'linkedin\.com/in/[A-Za-z0-9-]+',
             'github': r'github\.com/[A-Za-z0-9-]+',
-            'website': r'(https?://)?(www\.)?[A-Za-z0-9-]+\.[A-Za-z]{2,}'
+            # Possessive label run: the '.' that must follow can't be inside it, so backtracking never helps
+            'website': r'(?:https?://)?(?:www\.)?[A-Za-z0-9-]++\.[A-Za-z]{2,}'
+        }
+        self.contact_patterns = {
+            contact_type: re.compile(p, re.IGNORECASE)
+            for contact_type, p in self.contact_patterns.items()
         }
     
     def analyze_ats_compatibility(self, text: str, file_format: str = 'pdf') -> Dict[str, Any]:
@@ -93,17 +128,7 @@ class ATSService:
     
     def _analyze_file_format(self, file_format: str) -> Dict[str, Any]:
         """Analyze file format compatibility"""
-        format_scores = {
-            'pdf': {'score': 90, 'recommendation': 'Excellent choice - widely supported'},
-            'docx': {'score': 85, 'recommendation': 'Good choice - well supported'},
-            'doc': {'score': 70, 'recommendation': 'Acceptable but consider newer formats'},
-            'txt': {'score': 95, 'recommendation': 'Perfect for ATS but may lack formatting'},
-            'rtf': {'score': 75, 'recommendation': 'Acceptable but less common'},
-            'html': {'score': 60, 'recommendation': 'May have parsing issues'},
-            'unknown': {'score': 50, 'recommendation': 'Unknown format - use PDF or DOCX'}
-        }
-        
-        format_info = format_scores.get(file_format.lower(), format_scores['unknown'])
+        format_info = _FORMAT_SCORES.get(file_format.lower(), _FORMAT_SCORES['unknown'])
         
         return {
             'format': file_format,
@@ -160,11 +185,11 @@ class ATSService:
         }
         
         # Check for non-ASCII characters
-        non_ascii_chars = re.findall(r'[^\x00-\x7F]', text)
-        if non_ascii_chars:
-            unique_chars = set(non_ascii_chars)
+        if not text.isascii():
+            non_ascii_count = len(text) - len(text.encode('ascii', 'ignore'))
+            unique_chars = {c for c in set(text) if c > '\x7f'}
             analysis['issues'].append(f'Contains {len(unique_chars)} types of non-ASCII characters')
-            analysis['character_analysis']['non_ascii_count'] = len(non_ascii_chars)
+            analysis['character_analysis']['non_ascii_count'] = non_ascii_count
             analysis['character_analysis']['unique_non_ascii'] = list(unique_chars)[:10]  # Sample
             analysis['score'] -= 15
         
@@ -173,14 +198,20 @@ class ATSService:
             if category == 'graphics_indicators':
                 continue  # Handled separately
             
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    analysis['warnings'].append(f'Found {category}: {len(matches)} instances')
+            combined = self._combined_patterns.get(category)
+            if combined is not None:
+                counts = Counter(m.lastgroup for m in combined.finditer(text))
+                match_counts = [counts[f'g{i}'] for i in range(len(patterns))]
+            else:
+                match_counts = [len(pattern.findall(text)) for pattern in patterns]
+            
+            for match_count in match_counts:
+                if match_count:
+                    analysis['warnings'].append(f'Found {category}: {match_count} instances')
                     analysis['score'] -= 5
         
         # Check spacing patterns
-        excessive_spaces = re.findall(r' {3,}', text)
+        excessive_spaces = _EXCESSIVE_SPACES_RE.findall(text) if '   ' in text else []
         if excessive_spaces:
             analysis['spacing_analysis']['excessive_spaces'] = len(excessive_spaces)
             analysis['warnings'].append('Contains excessive spacing that may confuse ATS')
@@ -210,16 +241,16 @@ class ATSService:
         
         # Check for graphics indicators
         for pattern in self.problematic_patterns['graphics_indicators']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             if matches:
                 analysis['graphics_detected'] = True
                 analysis['graphics_indicators'].extend(matches[:5])  # Sample
         
         # Check for table indicators
         for pattern in self.problematic_patterns['table_indicators']:
-            if re.search(pattern, text):
+            if pattern.search(text):
                 analysis['tables_detected'] = True
-                analysis['table_indicators'].append(pattern)
+                analysis['table_indicators'].append(pattern.pattern)
         
         # Score deductions
         if analysis['graphics_detected']:
@@ -243,9 +274,9 @@ class ATSService:
         
         # Check for each contact type
         for contact_type, pattern in self.contact_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                analysis['found_contacts'][contact_type] = matches[0]  # Take first match
+            match = pattern.search(text)
+            if match:
+                analysis['found_contacts'][contact_type] = match.group(0)  # Take first match
             else:
                 analysis['missing_contacts'].append(contact_type)
         
@@ -344,20 +375,26 @@ class ATSService:
 # Global instance for backward compatibility
 _ats_service = ATSService()
 
+def _any_of(category: str) -> "re.Pattern[str]":
+    """One pattern matching wherever any pattern of the category would"""
+    patterns = _ats_service.problematic_patterns[category]
+    return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
+
+# ats_heuristics only needs to know whether anything matches, so search() can stop early
+_GRAPHICS_RE = _any_of('graphics_indicators')
+_TABLES_RE = _any_of('table_indicators')
+
 def ats_heuristics(resume_text: str) -> tuple[dict, float]:
     """Backward compatibility function for basic ATS checks"""
     text = resume_text or ""
     
-    # Use enhanced analysis but return simple format for compatibility
-    full_analysis = _ats_service.analyze_ats_compatibility(text)
-    
     checks = {
         "has_sections": has_sections(text),
         "has_contact_info": detect_contact_info(text),
-        "no_photos_or_graphics": not full_analysis['detailed_analysis']['graphics_tables']['graphics_detected'],
+        "no_photos_or_graphics": _GRAPHICS_RE.search(text) is None,
         "reasonable_length": 300 <= len(text) <= 9000,
-        "bullet_usage": bool(re.search(r"(^|\n)\s*[•\-\*]", text)),
-        "no_tables_detected": not full_analysis['detailed_analysis']['graphics_tables']['tables_detected'],
+        "bullet_usage": bool(_BULLET_RE.search(text)),
+        "no_tables_detected": _TABLES_RE.search(text) is None,
         "simple_headings": True,
         "no_excessive_columns": True,
         "no_header_footer_text": True,
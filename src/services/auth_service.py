@@ -6,17 +6,30 @@ Authentication Service for Phase 2
 """
 
 import jwt
+import time
 import bcrypt
+from argon2 import PasswordHasher, DEFAULT_TIME_COST, DEFAULT_MEMORY_COST, DEFAULT_PARALLELISM
+from argon2.exceptions import InvalidHashError, VerificationError
 from datetime import datetime, timedelta
 from flask import current_app
 from typing import Dict, Optional, Any, List
 import logging
+from ..utils.cache_utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+def _is_bcrypt_hash(hashed_password: str) -> bool:
+    return hashed_password.startswith(("$2a$", "$2b$", "$2y$"))
+
 class AuthService:
     def __init__(self, app=None):
         self.app = app
+        self._dummy_hash: Optional[str] = None
+        # Argon2id; hashes carry their own parameters, so retuning only affects new hashes
+        # (old ones are upgraded on login via needs_rehash)
+        self._password_hasher = PasswordHasher()
+        # Recently verified (token, type, secret) -> payload; clients resend the same token on every request
+        self._verified_tokens = TTLCache(maxsize=4096, ttl=60)
         if app:
             self.init_app(app)
     
@@ -25,22 +38,46 @@ class AuthService:
         app.config.setdefault('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
         app.config.setdefault('JWT_ACCESS_TOKEN_EXPIRES', timedelta(hours=24))
         app.config.setdefault('JWT_REFRESH_TOKEN_EXPIRES', timedelta(days=30))
+        app.config.setdefault('ARGON2_TIME_COST', DEFAULT_TIME_COST)
+        app.config.setdefault('ARGON2_MEMORY_COST', DEFAULT_MEMORY_COST)  # KiB
+        app.config.setdefault('ARGON2_PARALLELISM', DEFAULT_PARALLELISM)
+        self._password_hasher = PasswordHasher(
+            time_cost=app.config['ARGON2_TIME_COST'],
+            memory_cost=app.config['ARGON2_MEMORY_COST'],
+            parallelism=app.config['ARGON2_PARALLELISM'],
+        )
+        # Hashed up front so the first unknown-email login isn't slower than the rest
+        self._dummy_hash = self.hash_password("dummy-password-for-timing")
+        # Payloads verified for a previous app (or secret) must be checked again
+        self._verified_tokens.clear()
     
     def hash_password(self, password: str) -> str:
         """Hash a password for storing in database"""
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return self._password_hasher.hash(password)
     
     def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash"""
+        """Verify a password against its hash (Argon2id, or bcrypt for accounts not yet upgraded)"""
         try:
-            return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-        except Exception as e:
+            if _is_bcrypt_hash(hashed_password):
+                return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+            return self._password_hasher.verify(hashed_password, password)
+        except VerificationError:
+            return False
+        except (InvalidHashError, ValueError) as e:
             logger.error(f"Password verification error: {e}")
             return False
     
+    def verify_dummy_password(self, password: str) -> bool:
+        """Spend the same time as a real verification, for logins with an unknown email"""
+        if self._dummy_hash is None:  # only when used without init_app
+            self._dummy_hash = self.hash_password("dummy-password-for-timing")
+        self.verify_password(password, self._dummy_hash)
+        return False
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True if a stored hash is bcrypt or uses outdated Argon2 parameters"""
+        return _is_bcrypt_hash(hashed_password) or self._password_hasher.check_needs_rehash(hashed_password)
+    
     def generate_tokens(self, user_id: int, email: str) -> Dict[str, str]:
         """Generate access and refresh tokens for a user"""
         try:
@@ -84,10 +121,19 @@ class AuthService:
     
     def verify_token(self, token: str, token_type: str = 'access') -> Optional[Dict[str, Any]]:
         """Verify and decode a JWT token"""
+        secret = current_app.config['JWT_SECRET_KEY']
+        cache_key = (token, token_type, secret)
+        cached = self._verified_tokens.get(cache_key)
+        if cached is not None:
+            if time.time() >= cached['exp']:
+                logger.warning("Token has expired")
+                return None
+            return dict(cached)
+        
         try:
             payload = jwt.decode(
                 token,
-                current_app.config['JWT_SECRET_KEY'],
+                secret,
                 algorithms=['HS256']
             )
             
@@ -96,17 +142,19 @@ class AuthService:
                 logger.warning(f"Invalid token type: expected {token_type}, got {payload.get('type')}")
                 return None
             
-            # Check expiration
-            if datetime.utcnow() > datetime.fromtimestamp(payload['exp']):
+            # Check expiration (epoch seconds, same clock as the cache check above)
+            if time.time() >= payload['exp']:
                 logger.warning("Token has expired")
                 return None
             
-            return {
+            verified = {
                 'user_id': payload['user_id'],
                 'email': payload['email'],
                 'iat': payload['iat'],
                 'exp': payload['exp']
             }
+            self._verified_tokens.set(cache_key, verified)
+            return dict(verified)
             
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
@@ -6,35 +6,55 @@ try:
 except Exception:
     OpenAI = None  # type: ignore
 
-def _cosine(a: np.ndarray, b: np.ndarray) -> float:
-    na = np.linalg.norm(a); nb = np.linalg.norm(b)
-    if na == 0 or nb == 0: return 0.0
-    return float(np.dot(a, b) / (na * nb))
+_HASH_DIM = 256
+
+def _hash_vec(text: str | None) -> np.ndarray:
+    """Bag-of-words vector with each token hashed into one of _HASH_DIM buckets"""
+    toks = (text or "").lower().split()
+    if not toks: return np.zeros(_HASH_DIM)
+    idx = np.fromiter((hash(t) & (_HASH_DIM - 1) for t in toks), dtype=np.int64, count=len(toks))
+    return np.bincount(idx, minlength=_HASH_DIM).astype(float)
 
 class Embeddings:
     def __init__(self, api_key: str | None):
-        self.client = None; self.enabled = False
-        if api_key and OpenAI:
+        self._api_key = api_key; self._client = None
+        self.enabled = bool(api_key and OpenAI)
+
+    @property
+    def client(self):
+        """OpenAI client, built on first use so hash-only callers never pay for it"""
+        if self._client is None and self.enabled:
             try:
-                self.client = OpenAI(api_key=api_key); self.enabled = True
+                self._client = OpenAI(api_key=self._api_key)
             except Exception:
-                self.client = None; self.enabled = False
+                self.enabled = False
+        return self._client
 
     def embed(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_matrix(texts).tolist()
+
+    def _embed_matrix(self, texts: List[str]) -> np.ndarray:
+        """One row per text; the hashed bag-of-words fallback never leaves NumPy"""
         if self.enabled and self.client:
             try:
                 resp = self.client.embeddings.create(model="text-embedding-3-small", input=texts)
-                return [d.embedding for d in resp.data]
+                return np.array([d.embedding for d in resp.data], dtype=float)
             except Exception:
                 pass
-        vecs = []
-        for t in texts:
-            v = np.zeros(256, dtype=float)
-            for tok in (t or "").lower().split():
-                v[hash(tok) % 256] += 1.0
-            vecs.append(v.tolist())
-        return vecs
+        if not texts:
+            return np.zeros((0, _HASH_DIM))
+        return np.vstack([_hash_vec(t) for t in texts])
 
     def similarity(self, a: str, b: str) -> float:
-        v = self.embed([a, b])
-        return round(_cosine(np.array(v[0]), np.array(v[1])) * 100.0, 1)
\ No newline at end of file
+        return self.similarities(b, [a])[0]
+
+    def similarities(self, query: str, texts: List[str]) -> List[float]:
+        """similarity(text, query) for every text, embedding everything in one batch"""
+        if not texts:
+            return []
+        m = self._embed_matrix([query] + list(texts))
+        norms = np.linalg.norm(m, axis=1)
+        dots = m[1:] @ m[0]
+        denom = norms[1:] * norms[0]
+        sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0)
+        return [round(float(s) * 100.0, 1) for s in sims]
\ No newline at end of file
@@ -16,15 +16,15 @@ def parse_pdf(file_obj) -> str:
         
         # Try with PyPDF2
         pdf_reader = PyPDF2.PdfReader(file_obj)
-        text = ""
+        page_texts = []
         
         for page in pdf_reader.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + "\n"
+                page_texts.append(page_text + "\n")
         
         # Clean up text
-        text = clean_extracted_text(text)
+        text = clean_extracted_text("".join(page_texts))
         
         if not text.strip():
             logger.warning("No text extracted from PDF")
@@ -87,20 +87,18 @@ def parse_docx(file_obj) -> str:
 def parse_txt(file_obj) -> str:
     """Extract text from TXT file"""
     try:
+        # Read the upload once; each encoding attempt decodes the same bytes
         file_obj.seek(0)
+        content = file_obj.read()
+        if not isinstance(content, bytes):
+            return clean_extracted_text(content)
         
         # Try different encodings
         encodings = ['utf-8', 'latin-1', 'cp1252']
         
         for encoding in encodings:
             try:
-                file_obj.seek(0)
-                content = file_obj.read()
-                if isinstance(content, bytes):
-                    text = content.decode(encoding)
-                else:
-                    text = content
-                return clean_extracted_text(text)
+                return clean_extracted_text(content.decode(encoding))
             except UnicodeDecodeError:
                 continue
         
@@ -8,6 +8,7 @@ Comprehensive NLP Service for Resume Analysis
 
 import spacy
 import re
+from functools import lru_cache
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
@@ -188,12 +189,11 @@ class NLPService:
             return {"error": "Sentence transformer model not available"}
         
         try:
-            # Get embeddings
-            resume_embedding = self.sentence_model.encode([resume_text])
-            jd_embedding = self.sentence_model.encode([jd_text])
+            # Get embeddings (both texts in one forward pass)
+            embeddings = self.sentence_model.encode([resume_text, jd_text])
             
             # Calculate similarity
-            similarity = cosine_similarity(resume_embedding, jd_embedding)[0][0]
+            similarity = cosine_similarity(embeddings[:1], embeddings[1:])[0][0]
             
             return {
                 "overall_similarity": float(similarity),
@@ -212,19 +212,21 @@ class NLPService:
         alignments = {}
         
         try:
-            jd_embedding = self.sentence_model.encode([jd_text])
+            sections = [(name, text) for name, text in resume_sections.items() if text.strip()]
+            if not sections:
+                return alignments
             
-            for section_name, section_text in resume_sections.items():
-                if section_text.strip():
-                    section_embedding = self.sentence_model.encode([section_text])
-                    similarity = cosine_similarity(section_embedding, jd_embedding)[0][0]
-                    
-                    alignments[section_name] = {
-                        "similarity_score": float(similarity),
-                        "score_percentage": int(similarity * 100),
-                        "alignment_level": self._get_alignment_level(similarity),
-                        "word_count": len(section_text.split())
-                    }
+            # JD and every non-empty section are encoded in one batch, then compared in one matmul
+            embeddings = self.sentence_model.encode([jd_text] + [text for _, text in sections])
+            similarities = cosine_similarity(embeddings[1:], embeddings[:1])[:, 0]
+            
+            for (section_name, section_text), similarity in zip(sections, similarities):
+                alignments[section_name] = {
+                    "similarity_score": float(similarity),
+                    "score_percentage": int(similarity * 100),
+                    "alignment_level": self._get_alignment_level(similarity),
+                    "word_count": len(section_text.split())
+                }
             
             return alignments
         except Exception as e:
@@ -259,17 +261,33 @@ class NLPService:
 _nlp_service = NLPService()
 
 # Backward compatibility functions
+#
+# Extraction results are pure functions of the input text, and the same job posting (or the same
+# resume against different postings) is analyzed over and over, so they are memoized per text.
+# Callers get copies so nobody can mutate a cached entry.
+@lru_cache(maxsize=512)
+def _extract_sections_cached(text: str) -> Dict[str, str]:
+    return _nlp_service.extract_sections(text)
+
+@lru_cache(maxsize=2048)
+def _extract_keywords_cached(text: str, limit: int) -> Tuple[str, ...]:
+    return tuple(_nlp_service.extract_keywords_for_jd(text, limit))
+
+@lru_cache(maxsize=512)
+def _extract_entities_cached(text: str) -> Dict[str, List[str]]:
+    return _nlp_service.extract_named_entities(text)
+
 def extract_sections(text: str) -> Dict[str, str]:
     """Extract resume sections using enhanced patterns"""
-    return _nlp_service.extract_sections(text)
+    return dict(_extract_sections_cached(text))
 
 def extract_keywords_for_jd(text: str, limit: int = 50) -> List[str]:
     """Extract keywords from job description"""
-    return _nlp_service.extract_keywords_for_jd(text, limit)
+    return list(_extract_keywords_cached(text, limit))
 
 def extract_named_entities(text: str) -> Dict[str, List[str]]:
     """Extract named entities with custom skill patterns"""
-    return _nlp_service.extract_named_entities(text)
+    return {k: list(v) for k, v in _extract_entities_cached(text).items()}
 
 def calculate_semantic_similarity(resume_text: str, jd_text: str) -> Dict[str, float]:
     """Calculate semantic similarity between resume and job description"""
@@ -0,0 +1,121 @@
+"""
+Background persistence for request side effects
+- Analyze requests enqueue their result and return without waiting on the database
+- Logins enqueue their last_login (and password hash upgrade) write
+- A single daemon worker runs each write in its own commit
+"""
+
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from ..models.database import db, Analysis, AnalysisHistory, User
+
+logger = logging.getLogger(__name__)
+
+def save_analysis(user_id: int, analysis_data: Dict[str, Any]) -> Optional[int]:
+    """Save analysis results to database (needs an app context)"""
+    try:
+        now = datetime.utcnow()
+        analysis = Analysis(
+            user_id=user_id,
+            resume_text=analysis_data.get('input', {}).get('resume_text', '')[:5000],  # Truncate for storage
+            job_description_text=analysis_data.get('input', {}).get('job_description_text', '')[:5000],
+            scores=analysis_data.get('scores', {}),
+            keyword_analysis=analysis_data.get('keyword_analysis', {}),
+            ats_analysis=analysis_data.get('ats_analysis', {}),
+            semantic_analysis=analysis_data.get('enhanced_features', {}).get('semantic_similarity', {}),
+            named_entities=analysis_data.get('enhanced_features', {}).get('entities', {}),
+            suggestions=analysis_data.get('suggestions', []),
+            created_at=now
+        )
+        db.session.add(analysis)
+        db.session.flush()  # assigns analysis.id without a separate commit
+
+        db.session.add(AnalysisHistory(
+            user_id=user_id,
+            analysis_id=analysis.id,
+            action='analysis_completed',
+            timestamp=now
+        ))
+        db.session.commit()
+
+        logger.info("Saved analysis %s for user %s", analysis.id, user_id)
+        return analysis.id
+
+    except Exception as e:
+        logger.error("Failed to save analysis to database: %s", e)
+        db.session.rollback()
+        return None
+
+def record_login(user_id: int, login_time: datetime, new_password_hash: Optional[str] = None,
+                 verified_password_hash: Optional[str] = None) -> None:
+    """Store a successful login's timestamp, plus an upgraded password hash if one was computed
+
+    The upgrade only replaces verified_password_hash (the hash the login was checked against),
+    so a password changed while this write was queued is never reverted.
+    """
+    try:
+        db.session.query(User).filter(User.id == user_id).update(
+            {User.last_login: login_time}, synchronize_session=False
+        )
+        if new_password_hash is not None and verified_password_hash is not None:
+            db.session.query(User).filter(
+                User.id == user_id, User.password_hash == verified_password_hash
+            ).update({User.password_hash: new_password_hash}, synchronize_session=False)
+        db.session.commit()
+    except Exception as e:
+        logger.error("Failed to record login for user %s: %s", user_id, e)
+        db.session.rollback()
+
+class PersistenceQueue:
+    def __init__(self, app=None):
+        self.app = None
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        if app:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Remember the app whose context the worker writes in"""
+        self.app = app
+
+    def put(self, user_id: int, analysis_data: Dict[str, Any]) -> None:
+        """Queue an analysis for saving and return immediately"""
+        self.submit(save_analysis, user_id, analysis_data)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue fn(*args) to run on the worker inside the app context"""
+        self._ensure_worker()
+        self._queue.put((fn, args))
+
+    def join(self) -> None:
+        """Block until every queued write has finished"""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        # Started on first use rather than in init_app so it lives in the serving process
+        # (gunicorn --preload forks after create_app, and threads don't survive a fork)
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="analysis-persistence", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self._queue.get()
+            try:
+                with self.app.app_context():
+                    fn(*args)
+            except Exception as e:
+                logger.error("Persistence worker error: %s", e)
+            finally:
+                self._queue.task_done()
+
+# Global persistence queue instance
+persistence_queue = PersistenceQueue()
@@ -14,6 +14,7 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 import pdfkit
 from io import BytesIO
+from ..utils.cache_utils import TTLCache
 
 # Load spaCy model
 try:
@@ -232,13 +233,19 @@ class JobDescriptionAnalyzer:
             'cloud': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes'],
             'tools': ['Git', 'Jenkins', 'Terraform', 'Ansible']
         }
+        # Heuristic keywords per job description text; users re-run the same JD while editing their resume
+        self._keyword_cache = TTLCache(maxsize=512, ttl=3600)
     
     def extract_keywords(self, jd_text: str, use_llm: bool = False) -> List[Dict]:
         """Extract keywords from job description"""
         if use_llm:
+            # LLM output isn't deterministic, so it is never cached
             return self._extract_keywords_llm(jd_text)
-        else:
-            return self._extract_keywords_heuristic(jd_text)
+        keywords = self._keyword_cache.get(jd_text)
+        if keywords is None:
+            keywords = self._extract_keywords_heuristic(jd_text)
+            self._keyword_cache.set(jd_text, keywords)
+        return [dict(kw) for kw in keywords]
     
     def _extract_keywords_heuristic(self, text: str) -> List[Dict]:
         """Extract keywords using TF-IDF and skill taxonomy"""
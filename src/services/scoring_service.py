@@ -1,10 +1,15 @@
 from __future__ import annotations
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from rapidfuzz import fuzz
 from ..utils.text_utils import find_snippets
 
-def keyword_coverage(resume_text: str, jd_keywords: List[str]) -> Tuple[List[dict], List[str], float]:
+def keyword_coverage(resume_text: str, jd_keywords: List[str],
+                     coverage_limit: Optional[int] = None) -> Tuple[List[dict], List[str], float]:
+    # Every keyword counts toward the score and the missing list, but coverage entries (and
+    # their snippet scans) are only built for the first coverage_limit keywords
     coverage, missing = [], []
+    if coverage_limit is None:
+        coverage_limit = len(jd_keywords)
     resume_lower = (resume_text or "").lower()
     hits = 0
     for kw in jd_keywords:
@@ -18,12 +23,15 @@ def keyword_coverage(resume_text: str, jd_keywords: List[str]) -> Tuple[List[dic
             if fuzz.partial_ratio(kw_low, resume_lower) >= 90:
                 in_resume = True
                 count = 1
+        want_entry = len(coverage) < coverage_limit
         if in_resume:
             hits += 1
-            snippets = find_snippets(resume_text, kw, window=80)
-            coverage.append({"keyword": kw, "in_resume": True, "frequency": count, "context_snippets": snippets})
+            if want_entry:
+                snippets = find_snippets(resume_text, kw, window=80)
+                coverage.append({"keyword": kw, "in_resume": True, "frequency": count, "context_snippets": snippets})
         else:
             missing.append(kw)
-            coverage.append({"keyword": kw, "in_resume": False, "frequency": 0, "context_snippets": []})
+            if want_entry:
+                coverage.append({"keyword": kw, "in_resume": False, "frequency": 0, "context_snippets": []})
     keyword_score = (hits / max(1, len(jd_keywords))) * 100.0
     return coverage, missing, round(keyword_score, 1)
\ No newline at end of file
@@ -5,15 +5,17 @@ from .embeddings_service import Embeddings
 from ..models.schemas import SectionScore
 
 def section_semantic_alignment(resume_sections: Dict[str, str], jd_text: str) -> List[SectionScore]:
-    settings = current_app.config.get("SETTINGS")
-    emb = Embeddings(getattr(settings, "OPENAI_API_KEY", None))
+    emb = current_app.extensions.get("embeddings")
+    if emb is None:
+        settings = current_app.config.get("SETTINGS")
+        emb = Embeddings(getattr(settings, "OPENAI_API_KEY", None))
     out: List[SectionScore] = []
-    for name, content in resume_sections.items():
-        sim = emb.similarity(content, jd_text)
-        missing_terms: List[str] = []
-        for kw in set((jd_text or "").lower().split()):
-            if len(kw) > 3 and kw not in (content or "").lower():
-                missing_terms.append(kw)
+    # All sections and the JD are embedded in one batch (one API call / one pass) instead of per section
+    sims = emb.similarities(jd_text, list(resume_sections.values()))
+    jd_terms = [kw for kw in set((jd_text or "").lower().split()) if len(kw) > 3]
+    for (name, content), sim in zip(resume_sections.items(), sims):
+        content_lower = (content or "").lower()
+        missing_terms = [kw for kw in jd_terms if kw not in content_lower]
         out.append(SectionScore(section=name, similarity=sim, missing_terms=missing_terms[:8]))
     out.sort(key=lambda s: s.similarity, reverse=True)
     return out
\ No newline at end of file
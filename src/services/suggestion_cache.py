@@ -0,0 +1,71 @@
+from __future__ import annotations
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+_DIM = 512
+
+def _embed(text: str) -> np.ndarray:
+    """L2-normalized hashed bag-of-words vector (the same scheme as the Embeddings fallback)"""
+    v = np.zeros(_DIM, dtype=np.float32)
+    for tok in (text or "").lower().split():
+        v[hash(tok) % _DIM] += 1.0
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
+
+class SuggestionCache:
+    """Exact + near-duplicate cache for LLM suggestions.
+
+    Exact (resume, jd) pairs are a dict lookup. Otherwise the closest stored pair is
+    reused when both its resume and its job description are at least `threshold`
+    cosine-similar to the request, so small edits don't trigger a new LLM call.
+    """
+
+    def __init__(self, maxsize: int = 512, threshold: float = 0.9):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._exact: Dict[Tuple[str, str], List[str]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._resume_vecs = np.zeros((maxsize, _DIM), dtype=np.float32)
+        self._jd_vecs = np.zeros((maxsize, _DIM), dtype=np.float32)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def get(self, resume_text: str, jd_text: str) -> Optional[List[str]]:
+        key = (resume_text, jd_text)
+        with self._lock:
+            hit = self._exact.get(key)
+            if hit is not None:
+                return list(hit)
+            if not self._keys:
+                return None
+        resume_vec, jd_vec = _embed(resume_text), _embed(jd_text)
+        with self._lock:
+            size = len(self._keys)
+            # A pair only matches if *both* sides are close
+            scores = np.minimum(self._resume_vecs[:size] @ resume_vec, self._jd_vecs[:size] @ jd_vec)
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return list(self._exact[self._keys[best]])
+        return None
+
+    def add(self, resume_text: str, jd_text: str, suggestions: List[str]) -> None:
+        key = (resume_text, jd_text)
+        resume_vec, jd_vec = _embed(resume_text), _embed(jd_text)
+        with self._lock:
+            if key in self._exact:
+                self._exact[key] = list(suggestions)
+                return
+            # Ring buffer: once full, the oldest entry's slot is reused
+            slot = self._next
+            if len(self._keys) < self.maxsize:
+                self._keys.append(key)
+            else:
+                del self._exact[self._keys[slot]]
+                self._keys[slot] = key
+            self._exact[key] = list(suggestions)
+            self._resume_vecs[slot] = resume_vec
+            self._jd_vecs[slot] = jd_vec
+            self._next = (slot + 1) % self.maxsize
+
+suggestion_cache = SuggestionCache()
@@ -1,19 +1,21 @@
-from io import BytesIO
 from typing import Tuple
 from pdfminer.high_level import extract_text as pdf_extract
 from docx import Document
 
 def read_file_content(file_storage) -> Tuple[str, str]:
     filename = (file_storage.filename or "").lower()
-    data = file_storage.read()
+    # Parse straight from the upload's (spooled) stream instead of copying it into memory first;
+    # MAX_CONTENT_LENGTH already rejects oversized uploads with a 413 before we get here
+    stream = file_storage.stream
+    stream.seek(0)
     if filename.endswith(".pdf"):
-        text = pdf_extract(BytesIO(data))
+        text = pdf_extract(stream)
         return text, "application/pdf"
     elif filename.endswith(".docx"):
-        doc = Document(BytesIO(data))
+        doc = Document(stream)
         text = "\n".join(p.text for p in doc.paragraphs)
         return text, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     elif filename.endswith(".txt"):
-        return data.decode("utf-8", errors="ignore"), "text/plain"
+        return stream.read().decode("utf-8", errors="ignore"), "text/plain"
     else:
-        return data.decode("utf-8", errors="ignore"), "application/octet-stream"
\ No newline at end of file
+        return stream.read().decode("utf-8", errors="ignore"), "application/octet-stream"
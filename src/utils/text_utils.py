@@ -1,8 +1,12 @@
 import re
 from typing import List
 
+_WS_RE = re.compile(r"\s+")
+
 def normalize_ws(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    if not text:
+        return ""
+    return _WS_RE.sub(" ", text).strip()
 
 def split_sentences(text: str) -> List[str]:
     return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text or "") if s.strip()]
@@ -0,0 +1,4 @@
+import os
+
+# Importing the resume-generator routes must not run their spaCy warm-up during collection
+os.environ.setdefault("SKIP_WARMUP", "1")
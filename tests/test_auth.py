@@ -0,0 +1,162 @@
+import threading
+from datetime import datetime
+
+import bcrypt
+from flask import Flask
+
+from src.models.database import db, Analysis, AnalysisHistory, User
+from src.routes.auth import auth_bp
+from src.services import auth_service as auth_module
+from src.services.auth_service import auth_service
+from src.services.persistence import persistence_queue, record_login
+
+
+def make_app(tmp_path):
+    # Just the auth pieces of create_app, on a throwaway database file
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'auth.db'}"
+    app.config["JWT_SECRET_KEY"] = "test-secret"
+    db.init_app(app)
+    auth_service.init_app(app)
+    persistence_queue.init_app(app)
+    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def add_user(app, password_hash, email="jane@example.com"):
+    with app.app_context():
+        user = User(email=email, password_hash=password_hash, first_name="Jane", last_name="Doe")
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def login(client, password, email="jane@example.com"):
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def test_bcrypt_user_logs_in_and_is_upgraded_to_argon2(tmp_path):
+    app = make_app(tmp_path)
+    legacy_hash = bcrypt.hashpw(b"Sup3r-secret!", bcrypt.gensalt(rounds=4)).decode()
+    user_id = add_user(app, legacy_hash)
+    client = app.test_client()
+
+    assert login(client, "wrong-password").status_code == 401
+    assert login(client, "Sup3r-secret!").status_code == 200
+    persistence_queue.join()
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        assert user.password_hash.startswith("$argon2id$")
+        assert user.last_login is not None
+
+    # The upgraded hash keeps accepting the same password, and only that one
+    assert login(client, "wrong-password").status_code == 401
+    assert login(client, "Sup3r-secret!").status_code == 200
+
+
+def test_queued_hash_upgrade_does_not_revert_a_password_change(tmp_path):
+    app = make_app(tmp_path)
+    legacy_hash = bcrypt.hashpw(b"Sup3r-secret!", bcrypt.gensalt(rounds=4)).decode()
+    add_user(app, legacy_hash)
+    client = app.test_client()
+
+    # Hold the worker so the login's hash upgrade is still queued when the password changes
+    release = threading.Event()
+    persistence_queue.submit(release.wait)
+    r = login(client, "Sup3r-secret!")
+    assert r.status_code == 200
+    token = r.get_json()["tokens"]["access_token"]
+    r = client.put(
+        "/api/auth/profile",
+        json={"current_password": "Sup3r-secret!", "new_password": "N3w-Passw0rd!"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert r.status_code == 200
+    release.set()
+    persistence_queue.join()
+
+    assert login(client, "N3w-Passw0rd!").status_code == 200
+    assert login(client, "Sup3r-secret!").status_code == 401
+
+
+def test_unknown_email_uses_dummy_hash_prepared_at_init(tmp_path):
+    app = make_app(tmp_path)
+    dummy_hash = auth_service._dummy_hash
+    assert dummy_hash is not None
+
+    assert login(app.test_client(), "Sup3r-secret!", email="nobody@example.com").status_code == 401
+    assert auth_service._dummy_hash == dummy_hash
+
+
+def test_wrong_password_fails_for_both_hash_formats():
+    argon2_hash = auth_service.hash_password("Sup3r-secret!")
+    bcrypt_hash = bcrypt.hashpw(b"Sup3r-secret!", bcrypt.gensalt(rounds=4)).decode()
+    for stored in (argon2_hash, bcrypt_hash):
+        assert auth_service.verify_password("Sup3r-secret!", stored)
+        assert not auth_service.verify_password("Sup3r-secret?", stored)
+
+
+def test_queued_record_login_is_committed(tmp_path):
+    app = make_app(tmp_path)
+    user_id = add_user(app, auth_service.hash_password("Sup3r-secret!"))
+    login_time = datetime(2025, 1, 2, 3, 4, 5)
+
+    persistence_queue.submit(record_login, user_id, login_time)
+    persistence_queue.join()
+
+    with app.app_context():
+        assert db.session.get(User, user_id).last_login == login_time
+
+
+def test_queued_analysis_is_committed_with_history(tmp_path):
+    app = make_app(tmp_path)
+    user_id = add_user(app, auth_service.hash_password("Sup3r-secret!"))
+
+    persistence_queue.put(user_id, {
+        "input": {"resume_text": "Python developer", "job_description_text": "Python role"},
+        "scores": {"overall_score": 80},
+    })
+    persistence_queue.join()
+
+    with app.app_context():
+        analysis = db.session.query(Analysis).filter_by(user_id=user_id).one()
+        assert analysis.scores == {"overall_score": 80}
+        history = db.session.query(AnalysisHistory).filter_by(analysis_id=analysis.id).one()
+        assert history.action == "analysis_completed"
+
+
+def test_cached_token_rejected_after_expiry(tmp_path, monkeypatch):
+    app = make_app(tmp_path)
+    with app.app_context():
+        token = auth_service.generate_tokens(1, "a@example.com")["access_token"]
+        payload = auth_service.verify_token(token)
+        assert payload["user_id"] == 1
+
+        # The second call is served from the cache, which must still honour exp
+        monkeypatch.setattr(auth_module.time, "time", lambda: payload["exp"] + 1)
+        assert auth_service.verify_token(token) is None
+
+
+def test_cached_token_rejected_after_secret_change(tmp_path):
+    app = make_app(tmp_path)
+    with app.app_context():
+        token = auth_service.generate_tokens(1, "a@example.com")["access_token"]
+        assert auth_service.verify_token(token) is not None
+
+        app.config["JWT_SECRET_KEY"] = "rotated-secret"
+        assert auth_service.verify_token(token) is None
+
+
+def test_new_app_does_not_reuse_verified_tokens(tmp_path):
+    app = make_app(tmp_path)
+    with app.app_context():
+        token = auth_service.generate_tokens(1, "a@example.com")["access_token"]
+        assert auth_service.verify_token(token) is not None
+
+    other = make_app(tmp_path)
+    assert len(auth_service._verified_tokens._data) == 0
+    with other.app_context():
+        assert auth_service.verify_token(token) is not None